@@ -18,10 +18,14 @@ import shinyswatch          # pip install shinyswatch
 
 # Finally, import what we need from other local code files.
 from continuous_location import update_csv_beach
+from continuous_forecast import update_csv_forecast, FORECAST_UPDATE_INTERVAL
 from beachday_server import get_beachday_server_functions
 from beachday_ui_inputs import get_beachday_inputs
 from beachday_ui_outputs import get_beachday_outputs
+from util_diagnostics import start_diagnostics_controls
 from util_logger import setup_logger
+from util_render_cache import render_cache
+from util_sessions import session_registry
 
 # Set up a logger for this file (see the logs folder to help with debugging).
 logger, logname = setup_logger(__file__)
@@ -38,6 +42,29 @@ async def update_csv_files():
         # await asyncio.gather(task2)
         await asyncio.sleep(60)  # wait for 60 seconds
 
+
+# Forecasts cover the next 48 hours (and 8 days) in a single request per location,
+# so they only need refreshing on a much slower cadence than current conditions.
+async def update_forecast_files():
+    while True:
+        logger.info("Calling forecast updates ...")
+        await update_csv_forecast()
+        await asyncio.sleep(FORECAST_UPDATE_INTERVAL)
+
+
+# Log how well the shared caches are working, and the heaviest sessions,
+# once a minute for the whole process.
+async def log_server_stats():
+    while True:
+        await asyncio.sleep(60)
+        logger.info(f"Render cache: {render_cache.stats()}")
+        logger.info(session_registry.report())
+
+
+# Only one forecast loop (and one stats loop) is needed no matter how many sessions are open
+forecast_task = None
+stats_task = None
+
 app_ui = ui.page_navbar(
     shinyswatch.theme.vapor(),
     ui.nav(
@@ -68,8 +95,17 @@ def server(input, output, session):
 
     # Kick off continuous updates when the app starts
     asyncio.create_task(update_csv_files())
+    global forecast_task
+    if forecast_task is None or forecast_task.done():
+        forecast_task = asyncio.create_task(update_forecast_files())
+    global stats_task
+    if stats_task is None or stats_task.done():
+        stats_task = asyncio.create_task(log_server_stats())
     logger.info("Starting continuous updates ...")
 
+    # Watch for requests to turn on diagnostics or capture a profile (see util_diagnostics)
+    start_diagnostics_controls()
+
     get_beachday_server_functions(input, output, session)
 
 
@@ -29,6 +29,7 @@ reactive.event decorator (otherwise, the function won't be triggered).
 """
 
 # Standard Library
+from contextlib import contextmanager
 from pathlib import Path
 
 # External Libraries
@@ -36,11 +37,20 @@ import matplotlib.pyplot as plt
 import pandas as pd
 from plotnine import aes, geom_point, ggplot, ggtitle
 import plotly.express as px
-from shiny import render, reactive
+import plotly.graph_objects as go
+from shiny import render, reactive, req, ui
 from shinywidgets import render_widget
 
 # Local Imports
+from continuous_forecast import csv_forecasts, init_forecast_csv_file
+from beachday_table import filter_table_rows, get_table_page, index_by_location
+from util_diagnostics import stage
+from util_downsample import get_downsampled_df
 from util_logger import setup_logger
+from util_render_cache import render_cache
+from util_sessions import IDLE_CHECK_SECS, session_registry
+from util_snapshot import get_snapshot_version, read_snapshot
+from util_render_scheduler import PRIORITY_SELECTED, RENDER_DEBOUNCE_SECS, debounce
 
 # Set up a global logger for this file
 logger, logname = setup_logger(__name__)
@@ -49,6 +59,33 @@ logger, logname = setup_logger(__name__)
 csv_beaches = Path(__file__).parent.joinpath("data").joinpath("beaches.csv")
 
 
+def get_weather_summary(df, selected):
+    "Return a summary of the most recent weather readings (df) for the selected location"
+    selected_row = df[df['Location'] == selected]
+    if len(selected_row) == 0:
+        return f"{selected}\n\nNo recent weather readings are available yet."
+    temperature = selected_row['Temp_F'].iloc[0]
+    feels_like = selected_row['Feels_Like_Temp_F'].iloc[0]
+    humidity = selected_row['Humidity'].iloc[0]
+    wind_speed = selected_row['Wind_Speed'].iloc[0]
+    cloud_cover = selected_row['Cloud Cover'].iloc[0]
+
+    description = selected_row['Weather_Description'].iloc[0]
+    description = description[0].upper() + description[1:]
+
+    summary = f"""{selected}
+
+{description}
+
+• Current Temperature:  {temperature}°F
+• Feels Like:           {feels_like}°F
+• Humidity:             {humidity}%
+• Wind Speed:           {wind_speed} mph
+• Cloud Cover:          {cloud_cover}%
+"""
+    return summary
+
+
 def get_beachday_server_functions(input, output, session):
     """Define functions to create UI outputs."""
 
@@ -56,6 +93,18 @@ def get_beachday_server_functions(input, output, session):
     # Initialize the values on startup
 
     reactive_location = reactive.Value("Bondi Beach, Australia")
+    reactive_table_page = reactive.Value(None)
+    reactive_table_page_info = reactive.Value("")
+    reactive_suspended = reactive.Value(False)
+
+    # Account for the resources this session uses (see util_sessions)
+    session_stats = session_registry.register(session.id)
+
+    def end_session():
+        session_stats.release_widgets()
+        session_registry.unregister(session.id)
+
+    session.on_ended(end_session)
 
 
     ###############################################################
@@ -65,23 +114,130 @@ def get_beachday_server_functions(input, output, session):
     @reactive.Effect
     @reactive.event(input.BEACH_LOCATION_SELECT)
     def _():
-        """Set two reactive values (the location and temps df) when user changes location"""
-        reactive_location.set(input.BEACH_LOCATION_SELECT())
-        df = get_beaches_df()
-        logger.info(f"init reactive_temp_df len: {len(df)}")
-
-    @reactive.file_reader(str(csv_beaches))
-    def get_beaches_df():
+        """Set the location reactive value when user changes location"""
+        # Value.set() compares by identity, so skip equal strings to avoid a second render
+        if input.BEACH_LOCATION_SELECT() != reactive_location.get():
+            reactive_location.set(input.BEACH_LOCATION_SELECT())
+        logger.info(f"Selected location: {input.BEACH_LOCATION_SELECT()}")
+
+    @reactive.poll(lambda: get_snapshot_version(csv_beaches), 1)
+    def read_beaches_df():
+        """Read the latest snapshot - only called when its content hash changes"""
         logger.info(f"READING df from {csv_beaches}")
-        df = pd.read_csv(csv_beaches)
+        df, content_hash = read_snapshot(csv_beaches)
+        # Tag the data with a version so downstream caches know when it changes
+        df.attrs["data_version"] = content_hash
         logger.info(f"READING df len {len(df)}")
         return df
 
-    @reactive.file_reader(str(csv_beaches))
+    @debounce(RENDER_DEBOUNCE_SECS)
+    def get_render_state():
+        """Return the (location, df) to render, once changes have settled (None while suspended)"""
+        if reactive_suspended.get():
+            return None
+        return reactive_location.get(), read_beaches_df()
+
+    @debounce(RENDER_DEBOUNCE_SECS)
+    def get_render_location():
+        """Return the location to render (None while suspended) - new data doesn't change it"""
+        if reactive_suspended.get():
+            return None
+        return reactive_location.get()
+
+    # For render functions and the calcs they use. cancel_output=True is only safe
+    # inside render functions - Effects must check is_suspended() first.
+    def get_selected_location():
+        """Return the location, for outputs that don't show the beach readings"""
+        location = get_render_location()
+        # While suspended, outputs keep showing what they last rendered
+        req(location is not None, cancel_output=True)
+        return location
+
+    def get_beaches_state():
+        """Return the (location, df), for outputs that show the beach readings"""
+        state = get_render_state()
+        req(state is not None, cancel_output=True)
+        return state
+
+    def get_beaches_df():
+        return get_beaches_state()[1]
+
+    def is_suspended():
+        """Return True while this session is (or is becoming) suspended"""
+        return reactive_suspended.get() or get_render_state() is None
+
+    @contextmanager
+    def track_output(output_id):
+        """Account for the CPU time an output uses"""
+        with session_stats.track(output_id), stage(f"render:{output_id}"):
+            yield
+
+    def get_session_widget(output_id, figure):
+        """Wrap a shared figure in this session's own widget, and keep it so it can be closed"""
+        widget = go.FigureWidget(figure)
+        session_stats.set_widget(output_id, widget)
+        return widget
+
+    ############ IDLE SESSIONS ###################################################
+
+    last_activity = [None]
+
+    @reactive.Effect
+    def _():
+        """Track activity and page visibility, and suspend the session while hidden and idle"""
+        reactive.invalidate_later(IDLE_CHECK_SECS)
+        activity = (
+            input.BEACH_LOCATION_SELECT(),
+            input.BEACH_TABLE_SORT(),
+            input.BEACH_TABLE_DESCENDING(),
+            input.BEACH_TABLE_PAGE_SIZE(),
+            input.BEACH_TABLE_PAGE(),
+            input.BEACH_TABLE_FILTER(),
+        )
+        # Sent by the browser when the tab is hidden or shown (see beachday_ui_inputs)
+        if "BEACH_PAGE_VISIBLE" in input:
+            session_stats.visible = bool(input.BEACH_PAGE_VISIBLE())
+            activity += (session_stats.visible,)
+        if activity != last_activity[0]:
+            last_activity[0] = activity
+            session_stats.touch()
+
+        with reactive.isolate():
+            suspended = reactive_suspended.get()
+        if session_stats.should_suspend() and not suspended:
+            logger.info(f"Suspending idle session {session.id}")
+            session_stats.suspended = True
+            reactive_suspended.set(True)
+            reactive_table_page.set(None)
+            session_stats.release_frames()
+            # The charts are rebuilt when the session resumes
+            session_stats.release_widgets()
+        elif suspended and not session_stats.should_suspend():
+            logger.info(f"Resuming session {session.id}")
+            session_stats.suspended = False
+            reactive_suspended.set(False)
+
+    @reactive.Calc
+    def get_data_version():
+        return get_beaches_df().attrs.get("data_version")
+
+    def get_cache_key(output_id):
+        """Return the shared render cache key for an output of the selected location"""
+        return (output_id, get_beaches_state()[0], get_data_version())
+
+    def get_chart_df(metric):
+        """Return the downsampled readings of one metric for the selected location"""
+        location = get_beaches_state()[0]
+        df_location = get_beaches_by_location().get(location)
+        if df_location is None:
+            df_location = get_beaches_df().head(0)
+        return get_downsampled_df(df_location, location, metric, get_data_version())
+
+    @reactive.Calc
     def get_current_beaches_df():
         "Return a filtered dataframe that contains only the most recent record for every location"
-        logger.info(f"READING df from {csv_beaches}")
-        df = pd.read_csv(csv_beaches)
+        # Derived from the same read as get_beaches_df, so one file change is one invalidation
+        df = get_beaches_df().copy()
         
         # Convert 'Time' column to datetime
         df['Time'] = pd.to_datetime(df['Time'])
@@ -91,52 +247,108 @@ def get_beachday_server_functions(input, output, session):
         
         # Drop duplicates based on 'Location', keeping the first occurrence
         current_df = df.drop_duplicates(subset='Location', keep='first')
+        current_df.attrs["data_version"] = get_data_version()
+        session_stats.set_frame("current_beaches_df", current_df)
         
         return current_df
 
     ############ SUMMARY OF CURRENT WEATHER ###################################################
 
-    @output
+    @output(priority=PRIORITY_SELECTED)
     @render.text
     def beach_weather_summary():
         "Return a string that contains a summary of current weather data for selected location"
         logger.info("beach_weather_summary starting")
-        selected = reactive_location.get()
+        selected = get_beaches_state()[0]
         df = get_current_beaches_df()
+        key = ("beach_weather_summary", selected, df.attrs.get("data_version"))
+        with track_output("beach_weather_summary"):
+            return render_cache.get_or_render(key, lambda: get_weather_summary(df, selected))
 
-        selected_row = df[df['Location'] == selected]
-        temperature = selected_row['Temp_F'].iloc[0]
-        feels_like = selected_row['Feels_Like_Temp_F'].iloc[0]
-        humidity = selected_row['Humidity'].iloc[0]
-        wind_speed = selected_row['Wind_Speed'].iloc[0]
-        cloud_cover = selected_row['Cloud Cover'].iloc[0]
 
-        description = selected_row['Weather_Description'].iloc[0]
-        description = description[0].upper() + description[1:]
-
-        summary = f"""{selected}
+    ################## RECENT DATA FOR SELECTED BEACH #####
 
-{description}
+    @reactive.Calc
+    def get_beaches_by_location():
+        """Return the readings indexed by location (rebuilt once per data update)"""
+        beaches_by_location = index_by_location(get_beaches_df())
+        session_stats.set_frame("beaches_by_location", *beaches_by_location.values())
+        return beaches_by_location
 
-• Current Temperature:  {temperature}°F
-• Feels Like:           {feels_like}°F
-• Humidity:             {humidity}%
-• Wind Speed:           {wind_speed} mph
-• Cloud Cover:          {cloud_cover}%
-"""
-        return summary
+    last_table_view = [None]
+    last_num_pages = [None]
 
+    @reactive.Effect
+    def _():
+        """Slice out the visible table page, and only publish it when its rows change"""
+        # A plain req() quietly stops an Effect (cancel_output would end the session)
+        req(not is_suspended())
+        location = get_beaches_state()[0]
+        filter_text = input.BEACH_TABLE_FILTER()
+        sort_by = input.BEACH_TABLE_SORT()
+        descending = input.BEACH_TABLE_DESCENDING()
+        page_size = int(input.BEACH_TABLE_PAGE_SIZE())
+        requested_page = input.BEACH_TABLE_PAGE()
+
+        # Go back to the first page when the user changes what the table shows
+        view = (location, filter_text, sort_by, descending, page_size)
+        if last_table_view[0] is not None and view != last_table_view[0]:
+            requested_page = 1
+        last_table_view[0] = view
+
+        df_location = get_beaches_by_location().get(location)
+        if df_location is None:
+            df_location = get_beaches_df().head(0)
+        df_location = filter_table_rows(df_location, filter_text)
+        page_df, page, num_pages = get_table_page(
+            df_location, sort_by, descending, requested_page, page_size
+        )
 
-    ################## RECENT DATA FOR SELECTED BEACH #####
+        # Keep the page input in step with the page actually shown
+        if page != input.BEACH_TABLE_PAGE() or num_pages != last_num_pages[0]:
+            ui.update_numeric("BEACH_TABLE_PAGE", value=page, max=num_pages)
+            last_num_pages[0] = num_pages
+
+        key = (
+            "beach_table",
+            location,
+            get_data_version(),
+            filter_text,
+            sort_by,
+            descending,
+            page_size,
+            page,
+        )
+        with reactive.isolate():
+            current_page = reactive_table_page.get()
+        # New readings for other beaches (or off-page rows) don't re-send the table
+        if current_page is None or not page_df.equals(current_page[1]):
+            reactive_table_page.set((key, page_df))
+            session_stats.set_frame("table_page", page_df)
+        reactive_table_page_info.set(
+            f"Page {page} of {num_pages} ({len(df_location)} readings)"
+        )
 
     @output
-    @render.table
+    @render.text
+    def beach_table_page_info():
+        return reactive_table_page_info.get()
+
+    @output(priority=PRIORITY_SELECTED)
+    @render.ui
     def beach_table():
-        df = get_beaches_df()
-        # Filter the data based on the selected location
-        df_location = df[df["Location"] == reactive_location.get()]
-        logger.info(f"Rendering TEMP table with {len(df_location)} rows")
-        return df_location
+        current_page = reactive_table_page.get()
+        req(current_page is not None, cancel_output=True)
+        key, df_page = current_page
+
+        def render_table():
+            logger.info(f"Rendering TEMP table page with {len(df_page)} rows")
+            return ui.HTML(
+                df_page.to_html(index=False, border=0, classes="table shiny-table w-auto")
+            )
+
+        with track_output("beach_table"):
+            return render_cache.get_or_render(key, render_table)
 
 
 
@@ -147,7 +359,7 @@ def get_beachday_server_functions(input, output, session):
     def beach_temp_chart_string():
         """Return a string based on selected location."""
         logger.info("beach_string starting")
-        selected = reactive_location.get()
+        selected = get_selected_location()
         line1 = f"Recent Temperature in F for {selected}."
         line2 = "Updated once per minute for 15 minutes."
         line3 = "Keeps the most recent 10 minutes of data."
@@ -158,15 +370,19 @@ def get_beachday_server_functions(input, output, session):
     @output
     @render_widget
     def beach_temp_chart():
-        df = get_beaches_df()
-        # Filter the data based on the selected location
-        df_location = df[df["Location"] == reactive_location.get()]
-        logger.info(f"Rendering TEMP chart with {len(df_location)} points")
-        plotly_express_plot = px.line(
-            df_location, x="Time", y="Temp_F", color="Location", markers=True
-        )
-        plotly_express_plot.update_layout(title="Continuous Temperature (F)")
-        return plotly_express_plot
+        def render_chart():
+            df_location = get_chart_df("Temp_F")
+            logger.info(f"Rendering TEMP chart with {len(df_location)} points")
+            plotly_express_plot = px.line(
+                df_location, x="Time", y="Temp_F", color="Location", markers=True
+            )
+            plotly_express_plot.update_layout(title="Continuous Temperature (F)")
+            return plotly_express_plot
+
+        key = get_cache_key("beach_temp_chart")
+        with track_output("beach_temp_chart"):
+            figure = render_cache.get_or_render(key, render_chart)
+            return get_session_widget("beach_temp_chart", figure)
 
     ################# FEELS LIKE CHART ##########################
 
@@ -175,7 +391,7 @@ def get_beachday_server_functions(input, output, session):
     def beach_feels_like_chart_string():
         """Return a string based on selected location."""
         logger.info("beach_string starting")
-        selected = reactive_location.get()
+        selected = get_selected_location()
         line1 = f'Recent "Feels Like" Temperature in F for {selected}.'
         line2 = "Updated once per minute for 15 minutes."
         line3 = "Keeps the most recent 10 minutes of data."
@@ -186,15 +402,19 @@ def get_beachday_server_functions(input, output, session):
     @output
     @render_widget
     def beach_feels_like_chart():
-        df = get_beaches_df()
-        # Filter the data based on the selected location
-        df_location = df[df["Location"] == reactive_location.get()]
-        logger.info(f"Rendering Feels Like chart with {len(df_location)} points")
-        plotly_express_plot = px.line(
-            df_location, x="Time", y="Feels_Like_Temp_F", color="Location", markers=True
-        )
-        plotly_express_plot.update_layout(title="Continuous 'Feels Like' Temperature (F)")
-        return plotly_express_plot
+        def render_chart():
+            df_location = get_chart_df("Feels_Like_Temp_F")
+            logger.info(f"Rendering Feels Like chart with {len(df_location)} points")
+            plotly_express_plot = px.line(
+                df_location, x="Time", y="Feels_Like_Temp_F", color="Location", markers=True
+            )
+            plotly_express_plot.update_layout(title="Continuous 'Feels Like' Temperature (F)")
+            return plotly_express_plot
+
+        key = get_cache_key("beach_feels_like_chart")
+        with track_output("beach_feels_like_chart"):
+            figure = render_cache.get_or_render(key, render_chart)
+            return get_session_widget("beach_feels_like_chart", figure)
     
     ################# HUMIDITY CHART ##########################
 
@@ -203,7 +423,7 @@ def get_beachday_server_functions(input, output, session):
     def beach_humidity_chart_string():
         """Return a string based on selected location."""
         logger.info("beach_string starting")
-        selected = reactive_location.get()
+        selected = get_selected_location()
         line1 = f'Recent Humidity % for {selected}.'
         line2 = "Updated once per minute for 15 minutes."
         line3 = "Keeps the most recent 10 minutes of data."
@@ -214,15 +434,19 @@ def get_beachday_server_functions(input, output, session):
     @output
     @render_widget
     def beach_humidity_chart():
-        df = get_beaches_df()
-        # Filter the data based on the selected location
-        df_location = df[df["Location"] == reactive_location.get()]
-        logger.info(f"Rendering humidity chart with {len(df_location)} points")
-        plotly_express_plot = px.line(
-            df_location, x="Time", y="Humidity", color="Location", markers=True
-        )
-        plotly_express_plot.update_layout(title="Continuous Humidity %")
-        return plotly_express_plot
+        def render_chart():
+            df_location = get_chart_df("Humidity")
+            logger.info(f"Rendering humidity chart with {len(df_location)} points")
+            plotly_express_plot = px.line(
+                df_location, x="Time", y="Humidity", color="Location", markers=True
+            )
+            plotly_express_plot.update_layout(title="Continuous Humidity %")
+            return plotly_express_plot
+
+        key = get_cache_key("beach_humidity_chart")
+        with track_output("beach_humidity_chart"):
+            figure = render_cache.get_or_render(key, render_chart)
+            return get_session_widget("beach_humidity_chart", figure)
 
     ################# WIND SPEED CHART ##########################
 
@@ -231,7 +455,7 @@ def get_beachday_server_functions(input, output, session):
     def beach_wind_speed_chart_string():
         """Return a string based on selected location."""
         logger.info("beach_string starting")
-        selected = reactive_location.get()
+        selected = get_selected_location()
         line1 = f'Recent wind speed (mph) for {selected}.'
         line2 = "Updated once per minute for 15 minutes."
         line3 = "Keeps the most recent 10 minutes of data."
@@ -242,15 +466,19 @@ def get_beachday_server_functions(input, output, session):
     @output
     @render_widget
     def beach_wind_speed_chart():
-        df = get_beaches_df()
-        # Filter the data based on the selected location
-        df_location = df[df["Location"] == reactive_location.get()]
-        logger.info(f"Rendering wind speed chart with {len(df_location)} points")
-        plotly_express_plot = px.line(
-            df_location, x="Time", y="Wind_Speed", color="Location", markers=True
-        )
-        plotly_express_plot.update_layout(title="Continuous Wind Speed (mph)")
-        return plotly_express_plot
+        def render_chart():
+            df_location = get_chart_df("Wind_Speed")
+            logger.info(f"Rendering wind speed chart with {len(df_location)} points")
+            plotly_express_plot = px.line(
+                df_location, x="Time", y="Wind_Speed", color="Location", markers=True
+            )
+            plotly_express_plot.update_layout(title="Continuous Wind Speed (mph)")
+            return plotly_express_plot
+
+        key = get_cache_key("beach_wind_speed_chart")
+        with track_output("beach_wind_speed_chart"):
+            figure = render_cache.get_or_render(key, render_chart)
+            return get_session_widget("beach_wind_speed_chart", figure)
     
     ################# CLOUD COVER CHART ##########################
 
@@ -259,7 +487,7 @@ def get_beachday_server_functions(input, output, session):
     def beach_cloud_cover_chart_string():
         """Return a string based on selected location."""
         logger.info("beach_string starting")
-        selected = reactive_location.get()
+        selected = get_selected_location()
         line1 = f'Recent cloud cover % for {selected}.'
         line2 = "Updated once per minute for 15 minutes."
         line3 = "Keeps the most recent 10 minutes of data."
@@ -270,16 +498,79 @@ def get_beachday_server_functions(input, output, session):
     @output
     @render_widget
     def beach_cloud_cover_chart():
-        df = get_beaches_df()
-        # Filter the data based on the selected location
-        df_location = df[df["Location"] == reactive_location.get()]
-        logger.info(f"Rendering cloud cover % chart with {len(df_location)} points")
-        plotly_express_plot = px.line(
-            df_location, x="Time", y="Cloud Cover", color="Location", markers=True
-        )
-        plotly_express_plot.update_layout(title="Continuous Cloud Cover %")
-        return plotly_express_plot
+        def render_chart():
+            df_location = get_chart_df("Cloud Cover")
+            logger.info(f"Rendering cloud cover % chart with {len(df_location)} points")
+            plotly_express_plot = px.line(
+                df_location, x="Time", y="Cloud Cover", color="Location", markers=True
+            )
+            plotly_express_plot.update_layout(title="Continuous Cloud Cover %")
+            return plotly_express_plot
+
+        key = get_cache_key("beach_cloud_cover_chart")
+        with track_output("beach_cloud_cover_chart"):
+            figure = render_cache.get_or_render(key, render_chart)
+            return get_session_widget("beach_cloud_cover_chart", figure)
     
+    ################# FORECAST CHART ##########################
+
+    def get_forecasts_version():
+        # The forecast loop may not have written the file yet, so create it on first use
+        if not csv_forecasts.exists():
+            init_forecast_csv_file(csv_forecasts)
+        return get_snapshot_version(csv_forecasts)
+
+    @reactive.poll(get_forecasts_version, 1)
+    def get_forecasts_df():
+        logger.info(f"READING forecast df from {csv_forecasts}")
+        df, content_hash = read_snapshot(csv_forecasts)
+        df.attrs["data_version"] = content_hash
+        return df
+
+    @reactive.Calc
+    def get_latest_hourly_forecast():
+        "Return the hourly readings from the most recently issued forecast for the selected location"
+        df = get_forecasts_df()
+        df = df[(df["Location"] == get_selected_location()) & (df["Horizon"] == "hourly")]
+        if len(df) == 0:
+            return df
+        return df[df["Issued"] == df["Issued"].max()]
+
+    @output
+    @render.text
+    def beach_forecast_chart_string():
+        """Return a string based on selected location."""
+        selected = get_selected_location()
+        df = get_latest_hourly_forecast()
+        line1 = f"Hourly forecast temperature in F for {selected}."
+        if len(df) == 0:
+            line2 = "The forecast is not available yet."
+        else:
+            line2 = f"Forecast issued {df['Issued'].iloc[0]}."
+        line3 = "Forecasts are refreshed once per hour."
+        return f"{line1}\n{line2}\n{line3}"
+
+    @output
+    @render_widget
+    def beach_forecast_chart():
+        def render_chart():
+            df = get_latest_hourly_forecast()
+            logger.info(f"Rendering forecast chart with {len(df)} points")
+            plotly_express_plot = px.line(
+                df, x="Time", y=["Temp_F", "Feels_Like_Temp_F"], markers=True
+            )
+            plotly_express_plot.update_layout(title="Hourly Forecast Temperature (F)")
+            return plotly_express_plot
+
+        key = (
+            "beach_forecast_chart",
+            get_selected_location(),
+            get_forecasts_df().attrs.get("data_version"),
+        )
+        with track_output("beach_forecast_chart"):
+            figure = render_cache.get_or_render(key, render_chart)
+            return get_session_widget("beach_forecast_chart", figure)
+
     ###############################################################
 
     # return a list of function names for use in reactive outputs
@@ -287,6 +578,7 @@ def get_beachday_server_functions(input, output, session):
     return [
         beach_weather_summary,
         beach_temp_chart_string,
+        beach_table_page_info,
         beach_table,
         beach_temp_chart,
         beach_feels_like_chart_string,
@@ -296,7 +588,9 @@ def get_beachday_server_functions(input, output, session):
         beach_wind_speed_chart_string,
         beach_wind_speed_chart,
         beach_cloud_cover_chart_string,
-        beach_cloud_cover_chart
+        beach_cloud_cover_chart,
+        beach_forecast_chart_string,
+        beach_forecast_chart
     ]
 
 
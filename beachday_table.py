@@ -0,0 +1,78 @@
+"""
+Purpose: Provide server-side paging for the beach data table.
+
+Rather than sending every row for a beach to the browser, we index the
+readings by location once per data update, then filter, sort and slice on
+the server so only the visible page is rendered as HTML.
+
+These are plain pandas functions - nothing to do with Shiny - so they
+can be written and tested separately.
+"""
+
+# Standard Library
+import math
+
+# External Packages
+import pandas as pd
+
+# Columns the user may sort the table by (the first is the default)
+TABLE_SORT_COLUMNS = [
+    "Time",
+    "Temp_F",
+    "Feels_Like_Temp_F",
+    "Humidity",
+    "Wind_Speed",
+    "Cloud Cover",
+]
+
+# Rows per page offered to the user (the first is the default)
+TABLE_PAGE_SIZES = ["10", "25", "50", "100"]
+
+
+def index_by_location(df):
+    """Return a dictionary of location -> DataFrame of readings for that location."""
+    return {location: group for location, group in df.groupby("Location", sort=False)}
+
+
+def filter_table_rows(df_location, text):
+    """Return the readings whose weather description contains text (ignoring case)."""
+    text = (text or "").strip()
+    if not text:
+        return df_location
+    matches = df_location["Weather_Description"].astype(str).str.contains(
+        text, case=False, regex=False
+    )
+    return df_location[matches]
+
+
+def get_table_page(df_location, sort_by, descending, page, page_size):
+    """Return the requested page of rows, the (clamped) page number, and the page count.
+
+    @param df_location: the readings for a single location.
+    @param sort_by: the column to sort by.
+    @param descending: True to sort largest (or newest) first.
+    @param page: the 1-based page number requested.
+    @param page_size: the number of rows per page.
+    """
+    num_rows = len(df_location)
+    num_pages = max(1, math.ceil(num_rows / page_size))
+    page = min(max(1, int(page or 1)), num_pages)
+
+    if sort_by not in df_location.columns:
+        sort_by = TABLE_SORT_COLUMNS[0]
+
+    # nsmallest/nlargest only do the work needed for the rows we show,
+    # but they don't support strings, so fall back to a stable sort for those.
+    stop = page * page_size
+    start = stop - page_size
+    if pd.api.types.is_numeric_dtype(df_location[sort_by]):
+        if descending:
+            top = df_location.nlargest(stop, sort_by, keep="first")
+        else:
+            top = df_location.nsmallest(stop, sort_by, keep="first")
+    else:
+        top = df_location.sort_values(
+            by=sort_by, ascending=not descending, kind="stable"
+        ).head(stop)
+
+    return top.iloc[start:stop], page, num_pages
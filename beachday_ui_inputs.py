@@ -9,6 +9,8 @@ Preface IDs with the dataset name to avoid naming conflicts.
 from shiny import ui
 from random import randint
 
+from beachday_table import TABLE_PAGE_SIZES, TABLE_SORT_COLUMNS
+
 # Define the UI inputs and include our new selection options
 
 def get_beachday_inputs():
@@ -62,7 +64,48 @@ def get_beachday_inputs():
 
         ui.tags.p("(Unfortunately, I was unable to actually get this to toggle the charts in my outputs on and off before the deadline)"),
 
+        ui.hr(),
+        ui.h3("Table options"),
+        ui.input_text(
+            id="BEACH_TABLE_FILTER",
+            label="Weather description contains",
+            value="",
+        ),
+        ui.input_select(
+            id="BEACH_TABLE_SORT",
+            label="Sort by",
+            choices=TABLE_SORT_COLUMNS,
+            selected=TABLE_SORT_COLUMNS[0],
+        ),
+        ui.input_switch(
+            id="BEACH_TABLE_DESCENDING",
+            label="Newest / largest first",
+            value=True
+        ),
+        ui.input_select(
+            id="BEACH_TABLE_PAGE_SIZE",
+            label="Rows per page",
+            choices=TABLE_PAGE_SIZES,
+            selected=TABLE_PAGE_SIZES[0],
+        ),
+        ui.input_numeric(
+            id="BEACH_TABLE_PAGE",
+            label="Page",
+            value=1,
+            min=1,
+        ),
+
         ui.hr(),
         ui.p("🕒 Please be patient. Outputs may take a few seconds to load."),
         ui.tags.hr(),
+
+        # Tell the server when this browser tab is hidden or shown,
+        # so idle sessions in background tabs can be suspended.
+        ui.tags.script("""
+            function sendBeachPageVisible() {
+                Shiny.setInputValue("BEACH_PAGE_VISIBLE", document.visibilityState === "visible");
+            }
+            $(document).on("shiny:connected", sendBeachPageVisible);
+            document.addEventListener("visibilitychange", sendBeachPageVisible);
+        """),
     )
@@ -16,6 +16,7 @@ def get_beachday_outputs():
             ui.tags.br(),
 
             ui.h4("Recent weather data for your selected beach"),
+            ui.output_text("beach_table_page_info"),
             ui.output_ui("beach_table"),
             ui.tags.br(),
 
@@ -39,6 +40,10 @@ def get_beachday_outputs():
             output_widget("beach_cloud_cover_chart"),
             ui.tags.hr(),        
 
+            ui.output_text("beach_forecast_chart_string"),
+            output_widget("beach_forecast_chart"),
+            ui.tags.hr(),
+
         ),
         ui.p("Real-time weather data courtesy of Openweathermap's API")
     )
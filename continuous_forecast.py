@@ -0,0 +1,154 @@
+"""
+Use the Open Weather Map One Call API to store the hourly and daily forecast
+for our 10 beach destinations.
+
+One request per location returns the whole forecast horizon (48 hours and
+8 days), so we refresh forecasts far less often than current conditions.
+Forecasts are stored keyed by location and the time the forecast was issued.
+----------------------------
+One Call API 3.0 Information
+-----------------------------
+Go to: https://openweathermap.org/api/one-call-3
+"""
+
+# Standard Library
+from datetime import datetime
+from pathlib import Path
+import os
+
+# External Packages
+import pandas as pd
+
+# Local Imports
+from continuous_location import get_API_key, lookup_lat_long, BEACH_LOCATIONS
+from fetch_resilience import FetchFailedError, fetch_with_resilience
+from util_logger import setup_logger
+from util_snapshot import publish_snapshot
+
+# Set up a file logger
+logger, log_filename = setup_logger(__file__)
+
+csv_forecasts = Path(__file__).parent.joinpath("data").joinpath("forecasts.csv")
+
+# Refresh forecasts once an hour (current conditions update once a minute)
+FORECAST_UPDATE_INTERVAL = 60 * 60
+
+# Keep the most recent forecast issues for each location
+NUM_ISSUES_KEPT = 3
+
+FORECAST_COLUMNS = [
+    "Location",
+    "Issued",
+    "Horizon",
+    "Time",
+    "Temp_F",
+    "Feels_Like_Temp_F",
+    "Humidity",
+    "Wind_Speed",
+    "Cloud Cover",
+    "Weather_Description",
+]
+
+
+def format_unix_time(timestamp):
+    """Return a unix timestamp in the same string format as our other data."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+async def get_forecast_from_openweathermap(lat, long):
+    """Return the issue time and a list of hourly and daily forecast records."""
+    api_key = get_API_key()
+    one_call_url = f"https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={long}&exclude=minutely,alerts&appid={api_key}&units=imperial"
+    result = await fetch_with_resilience(
+        one_call_url, "json", validate=lambda data: isinstance(data, dict) and "current" in data
+    )
+
+    issued = format_unix_time(result.data["current"]["dt"])
+    records = []
+    for hour in result.data.get("hourly", []):
+        records.append({
+            "Horizon": "hourly",
+            "Time": format_unix_time(hour["dt"]),
+            "Temp_F": hour["temp"],
+            "Feels_Like_Temp_F": hour["feels_like"],
+            "Humidity": hour["humidity"],
+            "Wind_Speed": hour["wind_speed"],
+            "Cloud Cover": hour["clouds"],
+            "Weather_Description": hour["weather"][0]["description"],
+        })
+    for day in result.data.get("daily", []):
+        # Daily forecasts give a temperature per part of the day - use the daytime value
+        records.append({
+            "Horizon": "daily",
+            "Time": format_unix_time(day["dt"]),
+            "Temp_F": day["temp"]["day"],
+            "Feels_Like_Temp_F": day["feels_like"]["day"],
+            "Humidity": day["humidity"],
+            "Wind_Speed": day["wind_speed"],
+            "Cloud Cover": day["clouds"],
+            "Weather_Description": day["weather"][0]["description"],
+        })
+    return issued, records
+
+
+# Function to create or overwrite the CSV file with column headings
+def init_forecast_csv_file(file_path):
+    df_empty = pd.DataFrame(columns=FORECAST_COLUMNS)
+    publish_snapshot(df_empty, file_path)
+
+
+def keep_recent_issues(df, num_issues=NUM_ISSUES_KEPT):
+    """Return only the most recent forecast issues for each location."""
+    issues = df[["Location", "Issued"]].drop_duplicates()
+    issues = issues.sort_values(by="Issued", ascending=False)
+    recent = issues.groupby("Location", sort=False).head(num_issues)
+    return df.merge(recent, on=["Location", "Issued"], how="inner")
+
+
+async def update_csv_forecast():
+    """Fetch one forecast per location and add it to the forecast CSV file."""
+    logger.info("Calling update_csv_forecast")
+    try:
+        fp = csv_forecasts
+
+        # Check if the file exists, if not, create it with only the column headings
+        if not os.path.exists(fp):
+            init_forecast_csv_file(fp)
+
+        df_existing = pd.read_csv(fp)
+        new_frames = []
+
+        for location in BEACH_LOCATIONS:
+            lat, long = lookup_lat_long(location)
+            try:
+                issued, records = await get_forecast_from_openweathermap(lat, long)
+            except FetchFailedError as e:
+                # Skip this beach for now - the others still get updated
+                logger.error(f"Skipping forecast for {location}: {e.record}")
+                continue
+
+            # Skip forecasts we already have (the API issues them less often than we ask)
+            already_stored = (
+                (df_existing["Location"] == location) & (df_existing["Issued"] == issued)
+            ).any()
+            if already_stored:
+                logger.info(f"Forecast for {location} issued {issued} already stored")
+                continue
+
+            df_new = pd.DataFrame(records)
+            df_new.insert(0, "Issued", issued)
+            df_new.insert(0, "Location", location)
+            new_frames.append(df_new)
+
+        if not new_frames:
+            return
+
+        df = pd.concat([df_existing] + new_frames, ignore_index=True)
+        df = keep_recent_issues(df)[FORECAST_COLUMNS]
+
+        # Publish the DataFrame as a new snapshot (readers never see a half-written file)
+        manifest = publish_snapshot(df, fp)
+        logger.info(f"Saving forecast data to {fp} (generation {manifest['generation']})")
+
+    except Exception as e:
+        logger.error(f"ERROR in update_csv_forecast: {e}")
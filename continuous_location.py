@@ -20,13 +20,29 @@ from collections import deque
 from dotenv import load_dotenv
 
 # Local Imports
-from fetch import fetch_from_url
+from fetch_resilience import FetchFailedError, fetch_with_resilience
 from util_logger import setup_logger
+from util_snapshot import publish_snapshot
 
 # Set up a file logger
 logger, log_filename = setup_logger(__file__)
 
 
+# The beach destinations we store weather data for
+BEACH_LOCATIONS = [
+    "Bondi Beach, Australia",
+    "Copacabana Beach, Brazil",
+    "Waikiki Beach, Hawaii, USA",
+    "Malibu Beach, California, USA",
+    "Bora Bora Beach, French Polynesia",
+    "Anse Source d'Argent, Seychelles",
+    "Railay Beach, Thailand",
+    "Navagio Beach (Shipwreck Beach), Greece",
+    "Whitehaven Beach, Australia",
+    "Matira Beach, Bora Bora, French Polynesia",
+]
+
+
 def get_API_key():
     # Keep secrets in a .env file - load it, read the values.
     # Load environment variables from .env file
@@ -60,12 +76,21 @@ def lookup_lat_long(location):
     return lat, long
 
 
+def is_current_weather_payload(data):
+    """Return True if the data has every field we read (error payloads do not)."""
+    return isinstance(data, dict) and all(
+        key in data for key in ("main", "wind", "clouds", "weather")
+    )
+
+
 async def get_data_from_openweathermap(lat, long):
     # logger.info("Calling get_temperature_from_openweathermap for {lat}, {long}}")
     api_key = get_API_key()
     open_weather_url = f"https://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={long}&appid={api_key}&units=imperial"
     # logger.info(f"Calling fetch_from_url for {open_weather_url}")
-    result = await fetch_from_url(open_weather_url, "json")
+    result = await fetch_with_resilience(
+        open_weather_url, "json", validate=is_current_weather_payload
+    )
     # logger.info(f"Data from openweathermap: {result}")
     weather_data = {
             "temperature_f": result.data["main"]["temp"],
@@ -96,23 +121,23 @@ def init_csv_file(file_path):
                  , "Weather_Description"
                  ]
     )
-    df_empty.to_csv(file_path, index=False)
+    publish_snapshot(df_empty, file_path)
+
+
+def read_existing_records(file_path):
+    """Return the readings already saved in the CSV file (an empty list if there are none)."""
+    try:
+        df = pd.read_csv(file_path)
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        return []
+    return df.to_dict("records")
 
 
 async def update_csv_beach():
     """Update the CSV file with the latest location information."""
     logger.info("Calling update_csv_location")
     try:
-        locations = [   "Bondi Beach, Australia",
-                        "Copacabana Beach, Brazil",
-                        "Waikiki Beach, Hawaii, USA",
-                        "Malibu Beach, California, USA",
-                        "Bora Bora Beach, French Polynesia",
-                        "Anse Source d'Argent, Seychelles",
-                        "Railay Beach, Thailand",
-                        "Navagio Beach (Shipwreck Beach), Greece",
-                        "Whitehaven Beach, Australia",
-                        "Matira Beach, Bora Bora, French Polynesia"]
+        locations = BEACH_LOCATIONS
         update_interval = 60  # Update every 1 minute (60 seconds)
         total_runtime = 15 * 60  # Total runtime maximum of 15 minutes
         num_updates = 10 * len(locations) # Keep the most recent 10 readings
@@ -120,21 +145,29 @@ async def update_csv_beach():
         logger.info(f"total_runtime: {total_runtime}")
         logger.info(f"num_updates: {num_updates}")
 
-        # Use a deque to store just the last, most recent 10 readings in order
-        records_deque = deque(maxlen=num_updates)
-
         fp = Path(__file__).parent.joinpath("data").joinpath("beaches.csv")
 
         # Check if the file exists, if not, create it with only the column headings
         if not os.path.exists(fp):
             init_csv_file(fp)
 
+        # Use a deque to store just the last, most recent 10 readings in order.
+        # Start from the readings already saved, so a beach that fails to update
+        # keeps its last good readings instead of disappearing from the file.
+        records_deque = deque(read_existing_records(fp), maxlen=num_updates)
+
         logger.info(f"Initialized csv file at {fp}")
 
         for _ in range(num_updates):  # To get num_updates readings
+            num_new_records = 0
             for location in locations:
                 lat, long = lookup_lat_long(location)
-                new_weather_data = await get_data_from_openweathermap(lat, long)
+                try:
+                    new_weather_data = await get_data_from_openweathermap(lat, long)
+                except FetchFailedError as e:
+                    # Skip this beach for now - the others still get updated
+                    logger.error(f"Skipping {location} this round: {e.record}")
+                    continue
                 time_now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # Current time
                 new_record = {
                     "Location": location
@@ -149,13 +182,20 @@ async def update_csv_beach():
                     , "Weather_Description": new_weather_data["weather_description"]
                 }
                 records_deque.append(new_record)
+                num_new_records += 1
+
+            # If every beach failed, keep the data we already have
+            if num_new_records == 0:
+                logger.warning(f"No new weather data this round - keeping {fp} as it is")
+                await asyncio.sleep(update_interval)
+                continue
 
             # Use the deque to make a DataFrame
             df = pd.DataFrame(records_deque)
 
-            # Save the DataFrame to the CSV file, deleting its contents before writing
-            df.to_csv(fp, index=False, mode="w")
-            logger.info(f"Saving weather data to {fp}")
+            # Publish the DataFrame as a new snapshot (readers never see a half-written file)
+            manifest = publish_snapshot(df, fp)
+            logger.info(f"Saving weather data to {fp} (generation {manifest['generation']})")
 
             # Wait for update_interval seconds before the next reading
             await asyncio.sleep(update_interval)
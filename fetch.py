@@ -7,7 +7,7 @@ File: download.py
 """
 
 import json
-from typing import Any, Literal
+from typing import Any, Literal, Optional
 
 
 class HttpResponse:
@@ -17,7 +17,9 @@ class HttpResponse:
 
 
 async def fetch_from_url(
-    url: str, type: Literal["string", "bytes", "json"] = "string"
+    url: str,
+    type: Literal["string", "bytes", "json"] = "string",
+    timeout: Optional[float] = None,
 ) -> HttpResponse:
     """
     An async wrapper function for http requests that works in both regular Python and
@@ -37,6 +39,9 @@ async def fetch_from_url(
         parses the response as JSON, then converts it to a Python object, usually a
         dictionary or list.
 
+        timeout: Seconds to wait for the server before giving up (regular Python
+        only). If None, the default socket timeout is used.
+
     Returns:
         A HttpResponse object
     """
@@ -60,14 +65,21 @@ async def fetch_from_url(
         return HttpResponse(response.status, data)
 
     else:
+        import asyncio
+        import socket
         import urllib.request
 
-        response = urllib.request.urlopen(url)
-        if type == "json":
-            data = json.loads(response.read().decode("utf-8"))
-        elif type == "string":
-            data = response.read().decode("utf-8")
-        elif type == "bytes":
-            data = response.read()
-
-        return HttpResponse(response.status, data)
+        def read_url():
+            with urllib.request.urlopen(
+                url, timeout=socket.getdefaulttimeout() if timeout is None else timeout
+            ) as response:
+                if type == "json":
+                    data = json.loads(response.read().decode("utf-8"))
+                elif type == "string":
+                    data = response.read().decode("utf-8")
+                elif type == "bytes":
+                    data = response.read()
+                return HttpResponse(response.status, data)
+
+        # urlopen() blocks, so run it in a worker thread to keep the event loop free.
+        return await asyncio.to_thread(read_url)
@@ -0,0 +1,282 @@
+"""
+Purpose: Make web requests resilient, so one slow or failing upstream
+response never stalls or stops our continuous updates.
+
+fetch_with_resilience() wraps fetch_from_url() with:
+
+- bounded retries with exponential backoff (and a little random jitter)
+- a circuit breaker per host, so we stop calling a host that keeps failing
+  (timeouts, connection errors, 5xx, 429) and try again after a cool-down
+  period - client errors such as 401 or a bad payload don't count
+- optional hedged requests: if a response takes longer than the host's
+  recent 95th percentile latency, we send a duplicate request and use
+  whichever answers first
+- structured error records, logged and kept in recent_fetch_errors
+
+Every failure ends in a FetchFailedError carrying the error record, so
+callers only need to handle a single exception type.
+"""
+
+# Standard Library
+import asyncio
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+import random
+import re
+import time
+from typing import Any, Callable, Optional
+import urllib.error
+from urllib.parse import urlparse
+
+# Local Imports
+from fetch import HttpResponse, fetch_from_url
+from util_diagnostics import stage
+from util_logger import setup_logger
+
+# Set up a file logger
+logger, log_filename = setup_logger(__file__)
+
+# The most recent error records (newest last) for troubleshooting
+recent_fetch_errors = deque(maxlen=200)
+
+# HTTP status codes worth retrying - everything else in 4xx is our mistake
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+# Never hedge sooner than this, even if a host is usually very fast
+MIN_HEDGE_DELAY = 0.25
+
+
+@dataclass
+class FetchErrorRecord:
+    """A structured description of one failed request attempt."""
+
+    host: str
+    url: str
+    attempt: int
+    error_type: str
+    message: str
+    status: Optional[int] = None
+    retryable: bool = True
+    time: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+
+class FetchFailedError(Exception):
+    """Raised when a request has failed for good (or the circuit is open)."""
+
+    def __init__(self, record: FetchErrorRecord):
+        super().__init__(f"{record.error_type} fetching {record.url}: {record.message}")
+        self.record = record
+
+
+class CircuitBreaker:
+    """Stop calling a host after repeated failures, then let one trial request through.
+
+    The circuit is "closed" (requests allowed) until failure_threshold failures
+    in a row. It then "opens" (requests refused) for reset_timeout seconds, after
+    which it is "half-open": one request is allowed, and its result closes or
+    re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_progress = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self.trial_in_progress:
+            self.trial_in_progress = True
+            return True
+        return False
+
+    def cancel_trial(self) -> None:
+        """Forget a trial request that was cancelled before it finished."""
+        self.trial_in_progress = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_progress = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.trial_in_progress = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            # (Re-)open the circuit and restart the cool-down
+            self.opened_at = time.monotonic()
+
+
+class LatencyTracker:
+    """Keep the recent response times for a host and estimate its 95th percentile."""
+
+    def __init__(self, max_samples: int = 100, min_samples: int = 20):
+        self.samples = deque(maxlen=max_samples)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def p95(self) -> Optional[float]:
+        """Return the 95th percentile latency, or None until we have enough samples."""
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+
+_circuit_breakers = {}
+_latency_trackers = {}
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    if host not in _circuit_breakers:
+        _circuit_breakers[host] = CircuitBreaker()
+    return _circuit_breakers[host]
+
+
+def get_latency_tracker(host: str) -> LatencyTracker:
+    if host not in _latency_trackers:
+        _latency_trackers[host] = LatencyTracker()
+    return _latency_trackers[host]
+
+
+def redact_url(url: str) -> str:
+    """Return the URL with API keys removed, so it is safe to log."""
+    return re.sub(r"(appid|api_key|apikey|key)=[^&]*", r"\1=***", url, flags=re.IGNORECASE)
+
+
+def describe_error(error: Exception):
+    """Return the (status, retryable) for an exception raised while fetching."""
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code, error.code in RETRYABLE_STATUS_CODES
+    if isinstance(error, (ValueError, KeyError, TypeError)):
+        # The response could not be parsed or had the wrong shape
+        return None, False
+    # Timeouts, refused connections, DNS failures and so on
+    return None, True
+
+
+async def _hedged_fetch(url, type, timeout, hedge_after):
+    """Fetch url, sending a duplicate request if the first is slower than hedge_after."""
+    first = asyncio.create_task(fetch_from_url(url, type, timeout))
+    if hedge_after is None:
+        return await first
+
+    done, _ = await asyncio.wait({first}, timeout=hedge_after)
+    if done:
+        return first.result()
+
+    logger.info(f"Hedging slow request after {hedge_after:.2f}s: {redact_url(url)}")
+    second = asyncio.create_task(fetch_from_url(url, type, timeout))
+    pending = {first, second}
+    error = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                for other in pending:
+                    other.cancel()
+                return task.result()
+            error = task.exception()
+    raise error
+
+
+async def fetch_with_resilience(
+    url: str,
+    type: str = "string",
+    retries: int = 3,
+    backoff: float = 0.5,
+    timeout: float = 10.0,
+    hedge: bool = True,
+    validate: Optional[Callable[[Any], bool]] = None,
+) -> HttpResponse:
+    """
+    Fetch a URL with retries, per-host circuit breaking, and hedged requests.
+
+    Args:
+        url: The URL to download.
+
+        type: How to parse the content ("string", "bytes" or "json").
+
+        retries: How many times to retry after the first attempt fails.
+
+        backoff: Seconds to wait before the first retry (doubled each retry).
+
+        timeout: Seconds to wait for each request before giving up.
+
+        hedge: If True, send a duplicate request when a response is slower than
+        the host's recent 95th percentile latency.
+
+        validate: An optional function that returns True if the response data
+        looks right (for example, an error payload is missing expected keys).
+
+    Returns:
+        A HttpResponse object
+
+    Raises:
+        FetchFailedError: if every attempt failed, or the host's circuit is open.
+    """
+    host = urlparse(url).netloc
+    safe_url = redact_url(url)
+    breaker = get_circuit_breaker(host)
+    latency = get_latency_tracker(host)
+
+    for attempt in range(1, retries + 2):
+        if not breaker.allow_request():
+            record = FetchErrorRecord(
+                host, safe_url, attempt, "CircuitOpen",
+                f"too many recent failures for {host}", retryable=False,
+            )
+            recent_fetch_errors.append(record)
+            raise FetchFailedError(record)
+
+        started = time.monotonic()
+        try:
+            p95 = latency.p95() if hedge else None
+            hedge_after = None if p95 is None else max(p95, MIN_HEDGE_DELAY)
+            with stage(f"fetch:{host}"):
+                response = await _hedged_fetch(url, type, timeout, hedge_after)
+            if validate is not None and not validate(response.data):
+                raise ValueError(f"unexpected response: {str(response.data)[:200]}")
+        except asyncio.CancelledError:
+            # A cancelled half-open trial proves nothing - let the next request try
+            breaker.cancel_trial()
+            raise
+        except Exception as e:
+            status, retryable = describe_error(e)
+            if retryable:
+                breaker.record_failure()
+            else:
+                # The host answered (e.g. 401 for an endpoint we don't subscribe to),
+                # so it is not down - don't let one endpoint block the whole host
+                breaker.cancel_trial()
+            record = FetchErrorRecord(
+                host, safe_url, attempt, e.__class__.__name__,
+                redact_url(str(e)), status=status, retryable=retryable,
+            )
+            recent_fetch_errors.append(record)
+            logger.warning(f"Fetch failed: {asdict(record)}")
+
+            if not retryable or attempt > retries:
+                raise FetchFailedError(record) from e
+
+            delay = backoff * (2 ** (attempt - 1))
+            await asyncio.sleep(delay + random.uniform(0, delay / 2))
+            continue
+
+        latency.record(time.monotonic() - started)
+        breaker.record_success()
+        return response
@@ -0,0 +1,252 @@
+"""
+Purpose: Find out what is slowing down the event loop, without restarting.
+
+Data ingestion and every session's rendering share one asyncio event loop,
+so any blocking call stalls everyone. Diagnostics are off by default.
+Turn them on with BEACHDAY_DIAGNOSTICS=1 in the .env file, or while the
+app is running by creating an empty file logs/diagnostics.on (delete it to
+turn them off again).
+
+While diagnostics are on:
+
+- a watchdog thread logs a warning, with the stack of the event loop
+  thread, whenever the loop is blocked for longer than SLOW_CALLBACK_SECS
+- time spent in named stages (fetch, write, parse, each render function)
+  is recorded, see stage() and get_stage_report()
+
+To capture a sampling profile of the running server, create the file
+logs/profile.request (optionally containing the number of seconds to
+sample for). The profile is written to logs/profile-<time>.txt as
+"folded" stacks (one line per stack with a sample count), which can be
+read directly or turned into a flame graph, followed by the stage timings.
+"""
+
+# Standard Library
+import asyncio
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+import os
+import pathlib
+import sys
+import threading
+import time
+import traceback
+
+# External Packages
+from dotenv import load_dotenv
+
+# Local Imports
+from util_logger import setup_logger
+
+# Set up a file logger
+logger, log_filename = setup_logger(__file__)
+
+logs_dir = pathlib.Path("logs")
+diagnostics_on_file = logs_dir.joinpath("diagnostics.on")
+profile_request_file = logs_dir.joinpath("profile.request")
+
+# Warn when the event loop is blocked for longer than this
+SLOW_CALLBACK_SECS = 0.25
+
+# Profile length when the request file doesn't say, and the longest allowed
+DEFAULT_PROFILE_SECS = 30
+MAX_PROFILE_SECS = 300
+
+# Seconds between samples when profiling
+PROFILE_INTERVAL_SECS = 0.005
+
+# How often to check the control files
+CONTROL_CHECK_SECS = 5
+
+_stage_timings = {}
+_state = {"enabled": False, "watchdog": None, "control_task": None, "profiling": False}
+
+
+@contextmanager
+def stage(name):
+    """Record the wall-clock time spent in the with-block under name (when enabled)."""
+    if not _state["enabled"]:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        timing = _stage_timings.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+        timing["count"] += 1
+        timing["total"] += elapsed
+        timing["max"] = max(timing["max"], elapsed)
+
+
+def get_stage_report():
+    """Return the recorded stage timings, slowest total first, as lines of text."""
+    lines = [f"{'stage':40} {'count':>8} {'total_s':>10} {'mean_ms':>10} {'max_ms':>10}"]
+    ordered = sorted(_stage_timings.items(), key=lambda item: item[1]["total"], reverse=True)
+    for name, timing in ordered:
+        mean_ms = 1000 * timing["total"] / timing["count"]
+        lines.append(
+            f"{name:40} {timing['count']:>8} {timing['total']:>10.3f} "
+            f"{mean_ms:>10.2f} {1000 * timing['max']:>10.2f}"
+        )
+    return lines
+
+
+def format_thread_stack(thread_id):
+    """Return the current stack of a thread as text."""
+    frame = sys._current_frames().get(thread_id)
+    if frame is None:
+        return "(thread not found)"
+    return "".join(traceback.format_stack(frame))
+
+
+class LoopWatchdog(threading.Thread):
+    """A background thread that reports when the event loop stops responding.
+
+    It regularly asks the loop to run a tiny callback. If the callback hasn't
+    run within threshold seconds, whatever the loop is running is blocking it,
+    so we log the loop thread's stack.
+    """
+
+    def __init__(self, loop, loop_thread_id, threshold=SLOW_CALLBACK_SECS):
+        super().__init__(name="loop-watchdog", daemon=True)
+        self.loop = loop
+        self.loop_thread_id = loop_thread_id
+        self.threshold = threshold
+        self.stopped = threading.Event()
+        self.posted_at = None
+        self.reported = False
+
+    def heartbeat(self):
+        """Runs on the event loop - proves it is responsive."""
+        if self.reported:
+            blocked = time.monotonic() - self.posted_at
+            logger.warning(f"Event loop unblocked after {blocked:.3f}s")
+        self.posted_at = None
+        self.reported = False
+
+    def run(self):
+        while not self.stopped.wait(self.threshold / 2):
+            posted_at = self.posted_at
+            if posted_at is None:
+                self.posted_at = time.monotonic()
+                self.loop.call_soon_threadsafe(self.heartbeat)
+            elif not self.reported and time.monotonic() - posted_at > self.threshold:
+                self.reported = True
+                logger.warning(
+                    f"Event loop blocked for more than {self.threshold}s in:\n"
+                    f"{format_thread_stack(self.loop_thread_id)}"
+                )
+
+    def stop(self):
+        self.stopped.set()
+
+
+def enable_diagnostics():
+    """Start the watchdog and stage timing (must be called on the event loop)."""
+    if _state["enabled"]:
+        return
+    _state["enabled"] = True
+    watchdog = LoopWatchdog(asyncio.get_running_loop(), threading.get_ident())
+    watchdog.start()
+    _state["watchdog"] = watchdog
+    logger.info("Diagnostics enabled")
+
+
+def disable_diagnostics():
+    if not _state["enabled"]:
+        return
+    _state["enabled"] = False
+    _state["watchdog"].stop()
+    _state["watchdog"] = None
+    logger.info("Diagnostics disabled")
+
+
+def capture_profile(loop_thread_id, seconds, output_path):
+    """Sample the event loop thread's stack for some seconds and write folded stacks.
+
+    Runs in its own thread, so the event loop carries on as normal.
+    """
+    try:
+        samples = Counter()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            frame = sys._current_frames().get(loop_thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            if stack:
+                samples[";".join(reversed(stack))] += 1
+            time.sleep(PROFILE_INTERVAL_SECS)
+
+        with open(output_path, "w") as file_wrapper:
+            file_wrapper.write(f"# {sum(samples.values())} samples over {seconds}s\n")
+            for stack, count in samples.most_common():
+                file_wrapper.write(f"{stack} {count}\n")
+            file_wrapper.write("\n# Stage timings\n")
+            for line in get_stage_report():
+                file_wrapper.write(f"# {line}\n")
+        logger.info(f"Profile written to {output_path}")
+    except Exception:
+        logger.exception(f"Failed to write profile to {output_path}")
+    finally:
+        # Always allow the next profile request, even if this one failed
+        _state["profiling"] = False
+
+
+def start_profile(seconds=DEFAULT_PROFILE_SECS):
+    """Start a time-boxed sampling profile of the event loop (must be called on the loop)."""
+    if _state["profiling"]:
+        logger.info("A profile is already being captured")
+        return None
+    _state["profiling"] = True
+    seconds = min(max(1, seconds), MAX_PROFILE_SECS)
+    output_path = logs_dir.joinpath(f"profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}.txt")
+    logger.info(f"Capturing a {seconds}s profile to {output_path}")
+    threading.Thread(
+        target=capture_profile,
+        args=(threading.get_ident(), seconds, output_path),
+        name="loop-profiler",
+        daemon=True,
+    ).start()
+    return output_path
+
+
+def read_profile_request():
+    """Return the seconds requested in the profile request file, and remove it."""
+    try:
+        text = profile_request_file.read_text().strip()
+    except FileNotFoundError:
+        return None
+    profile_request_file.unlink(missing_ok=True)
+    try:
+        return int(float(text)) if text else DEFAULT_PROFILE_SECS
+    except ValueError:
+        return DEFAULT_PROFILE_SECS
+
+
+async def watch_diagnostics_controls():
+    """Turn diagnostics on and off, and start profiles, from the control files."""
+    load_dotenv()
+    enabled_by_env = os.getenv("BEACHDAY_DIAGNOSTICS", "").lower() in ("1", "true", "yes")
+    while True:
+        if enabled_by_env or diagnostics_on_file.exists():
+            enable_diagnostics()
+        else:
+            disable_diagnostics()
+
+        seconds = read_profile_request()
+        if seconds is not None:
+            start_profile(seconds)
+
+        await asyncio.sleep(CONTROL_CHECK_SECS)
+
+
+def start_diagnostics_controls():
+    """Start watching the control files, once per process (must be called on the loop)."""
+    task = _state["control_task"]
+    if task is None or task.done():
+        _state["control_task"] = asyncio.create_task(watch_diagnostics_controls())
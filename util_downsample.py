@@ -0,0 +1,106 @@
+"""
+Purpose: Downsample long time series before they are sent to a chart.
+
+A chart about 600 pixels wide can't show more than about one point per
+pixel, so once the history for a beach grows we keep only the points that
+preserve the visual shape of the line, using the
+Largest-Triangle-Three-Buckets (LTTB) algorithm.
+
+Results are cached per (location, metric, data version, range), so each
+chart is downsampled once per data update rather than once per render.
+
+Reference: Sveinn Steinarsson, "Downsampling Time Series for Visual
+Representation" (2013).
+"""
+
+# Standard Library
+from collections import OrderedDict
+import math
+
+# External Packages
+import numpy as np
+import pandas as pd
+
+# Approximate plot width in pixels - we keep at most one point per pixel
+CHART_WIDTH_PX = 600
+
+# How many downsampled series to keep (oldest are evicted first)
+MAX_CACHE_ENTRIES = 256
+
+_downsample_cache = OrderedDict()
+
+
+def lttb_indices(x, y, threshold):
+    """Return the indices of the points LTTB keeps from x, y (numpy arrays).
+
+    The first and last points are always kept. If there are no more than
+    threshold points, every index is returned.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Every bucket except the first and last (which hold one point each)
+    every = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    a = 0
+
+    for i in range(threshold - 2):
+        # The average of the next bucket is the third corner of the triangle
+        avg_start = int(math.floor((i + 1) * every)) + 1
+        avg_end = min(int(math.floor((i + 2) * every)) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+
+        # Keep the point in this bucket that makes the largest triangle
+        range_start = int(math.floor(i * every)) + 1
+        range_end = int(math.floor((i + 1) * every)) + 1
+        areas = np.abs(
+            (x[a] - avg_x) * (y[range_start:range_end] - y[a])
+            - (x[a] - x[range_start:range_end]) * (avg_y - y[a])
+        )
+        a = range_start + int(np.argmax(areas))
+        indices[i + 1] = a
+
+    indices[-1] = n - 1
+    return indices
+
+
+def downsample_df(df, x, y, threshold=CHART_WIDTH_PX):
+    """Return the rows of df (sorted by x) that LTTB keeps for plotting y against x."""
+    df = df.dropna(subset=[y])
+    if len(df) <= threshold:
+        return df
+
+    df = df.sort_values(by=x, kind="stable")
+    x_values = pd.to_datetime(df[x]).to_numpy().astype("datetime64[ns]").astype(np.int64)
+    y_values = df[y].to_numpy(dtype=float)
+    # Scale x down so the areas don't overflow float precision
+    x_values = (x_values - x_values[0]) / 1e9
+    return df.iloc[lttb_indices(x_values, y_values, threshold)]
+
+
+def get_downsampled_df(df_location, location, metric, data_version, threshold=CHART_WIDTH_PX):
+    """Return the downsampled readings for one location and metric, using the cache.
+
+    @param df_location: the readings for the location (must include a Time column).
+    @param location: the location name (part of the cache key).
+    @param metric: the column to plot (part of the cache key).
+    @param data_version: changes whenever the underlying data changes.
+    @param threshold: the maximum number of points to keep.
+    """
+    if len(df_location) == 0:
+        return df_location
+
+    time_range = (df_location["Time"].min(), df_location["Time"].max())
+    key = (location, metric, data_version, time_range, threshold)
+    if key in _downsample_cache:
+        _downsample_cache.move_to_end(key)
+        return _downsample_cache[key]
+
+    result = downsample_df(df_location, "Time", metric, threshold)
+    _downsample_cache[key] = result
+    if len(_downsample_cache) > MAX_CACHE_ENTRIES:
+        _downsample_cache.popitem(last=False)
+    return result
@@ -0,0 +1,62 @@
+"""
+Purpose: Share rendered outputs between sessions.
+
+Every session viewing the same beach would otherwise build the same
+summary string, table HTML and Plotly figures. Outputs are cached by
+(output id, location, data version, ...) so each one is rendered once per
+data update, no matter how many users are watching.
+
+The cache is bounded: the least recently used entries are evicted first.
+Hit, miss and eviction counts are kept so we can check it is working.
+
+Cached values are shared, so treat them as read-only.
+
+For the charts, what is shared is the Plotly figure (px.line plus the
+downsampling). Each session still wraps the figure in its own FigureWidget,
+which shinywidgets serialises to JSON separately for every session, so that per-session
+cost is not saved here - downsampling is what keeps it small.
+"""
+
+# Standard Library
+from collections import OrderedDict
+
+
+class RenderCache:
+    """A bounded least-recently-used cache of rendered outputs with hit/miss counters."""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_render(self, key, render_function):
+        """Return the cached value for key, calling render_function() to create it if needed."""
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        self.misses += 1
+        value = render_function()
+        self.entries[key] = value
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def stats(self):
+        """Return a dictionary of cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+# One cache shared by every session in this process
+render_cache = RenderCache()
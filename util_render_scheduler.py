@@ -0,0 +1,75 @@
+"""
+Purpose: Keep bursts of updates from multiplying render work.
+
+debounce() coalesces invalidations: a debounced reactive calculation only
+updates once its inputs have stopped changing for a short window, so a
+location change and a data update arriving together cause one re-render,
+and the states in between are never rendered at all.
+
+Ordering is left to Shiny: outputs with a higher @output(priority=...) are
+rendered first in each flush, and outputs that are hidden in the browser
+are not rendered until they are shown (suspend_when_hidden, the default).
+"""
+
+# Standard Library
+import time
+
+# External Packages
+from shiny import reactive
+
+# Seconds to wait for more changes before re-rendering
+RENDER_DEBOUNCE_SECS = 0.5
+
+# Output priority for the selected beach's summary and table (charts use the default, 0)
+PRIORITY_SELECTED = 10
+
+
+def debounce(delay_secs=RENDER_DEBOUNCE_SECS):
+    """Decorator: return a reactive.Calc that only updates after its inputs
+    have stopped changing for delay_secs seconds.
+
+    Must be used inside a Shiny server function (it creates reactive effects).
+    """
+
+    def wrapper(f):
+        when = reactive.Value(None)
+        trigger = reactive.Value(0)
+        first_run = [True]
+
+        @reactive.Calc
+        def original():
+            return f()
+
+        @reactive.Effect(priority=102)
+        def _():
+            """Restart the timer whenever the inputs change"""
+            original()
+            if first_run[0]:
+                # The initial value is used as-is - there is nothing to coalesce yet
+                first_run[0] = False
+                return
+            when.set(time.monotonic() + delay_secs)
+
+        @reactive.Effect(priority=101)
+        def _():
+            """Fire once the inputs have been quiet for delay_secs"""
+            deadline = when.get()
+            if deadline is None:
+                return
+            now = time.monotonic()
+            if now >= deadline:
+                when.set(None)
+                with reactive.isolate():
+                    trigger.set(trigger.get() + 1)
+            else:
+                reactive.invalidate_later(deadline - now)
+
+        @reactive.Calc
+        @reactive.event(trigger, ignore_none=False)
+        def debounced():
+            with reactive.isolate():
+                return original()
+
+        return debounced
+
+    return wrapper
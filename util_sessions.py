@@ -0,0 +1,154 @@
+"""
+Purpose: Account for the resources each browser session uses, so we can
+find the heaviest sessions and reclaim idle ones.
+
+For every session we record:
+
+- CPU seconds and render counts for each output
+- the approximate memory held by the session's own data frames
+- the chart widgets built for the session (each one is kept by ipywidgets
+  on the server until it is closed)
+- when the user last did something, and whether the page is visible
+
+A session that is hidden and idle for IDLE_TIMEOUT_SECS is marked as
+suspended. The server stops updating its outputs, frees its frames and
+closes its chart widgets. The charts are rebuilt when the user comes back.
+"""
+
+# Standard Library
+from contextlib import contextmanager
+import time
+
+# Sessions hidden and idle for this long are suspended
+IDLE_TIMEOUT_SECS = 10 * 60
+
+# How often to check whether a session has gone idle
+IDLE_CHECK_SECS = 30
+
+
+def get_frame_bytes(df):
+    """Return the approximate memory used by a DataFrame (or 0 for None)."""
+    if df is None:
+        return 0
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class SessionStats:
+    """Resource usage for one session."""
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.started = time.monotonic()
+        self.last_active = self.started
+        self.visible = True
+        self.suspended = False
+        self.cpu_seconds = {}
+        self.render_counts = {}
+        self.frame_bytes = {}
+        self.widgets = {}
+
+    def touch(self):
+        """Record user activity."""
+        self.last_active = time.monotonic()
+
+    def idle_seconds(self):
+        return time.monotonic() - self.last_active
+
+    def should_suspend(self, idle_timeout=IDLE_TIMEOUT_SECS):
+        return not self.visible and self.idle_seconds() >= idle_timeout
+
+    @contextmanager
+    def track(self, output_id):
+        """Add the CPU time spent in the with-block to output_id.
+
+        Renders run on the event loop thread, so only that thread's CPU time
+        is counted - not fetches in worker threads or the profiler.
+        """
+        started = time.thread_time()
+        try:
+            yield
+        finally:
+            elapsed = time.thread_time() - started
+            self.cpu_seconds[output_id] = self.cpu_seconds.get(output_id, 0.0) + elapsed
+            self.render_counts[output_id] = self.render_counts.get(output_id, 0) + 1
+
+    def set_frame(self, name, *frames):
+        """Record the memory held by one or more of this session's frames (None to release)."""
+        frames = [df for df in frames if df is not None]
+        if frames:
+            self.frame_bytes[name] = sum(get_frame_bytes(df) for df in frames)
+        else:
+            self.frame_bytes.pop(name, None)
+
+    def release_frames(self):
+        self.frame_bytes.clear()
+
+    def set_widget(self, output_id, widget):
+        """Keep the widget built for output_id, closing the one it replaces."""
+        previous = self.widgets.get(output_id)
+        if previous is not None and previous is not widget:
+            previous.close()
+        self.widgets[output_id] = widget
+
+    def release_widgets(self):
+        """Close every widget built for this session, so ipywidgets can free them."""
+        for widget in self.widgets.values():
+            widget.close()
+        self.widgets.clear()
+
+    def total_cpu_seconds(self):
+        return sum(self.cpu_seconds.values())
+
+    def total_frame_bytes(self):
+        return sum(self.frame_bytes.values())
+
+    def summary(self):
+        """Return a dictionary describing this session."""
+        return {
+            "session": self.session_id,
+            "cpu_seconds": round(self.total_cpu_seconds(), 3),
+            "renders": sum(self.render_counts.values()),
+            "frame_kb": round(self.total_frame_bytes() / 1024, 1),
+            "widgets": len(self.widgets),
+            "idle_seconds": round(self.idle_seconds()),
+            "visible": self.visible,
+            "suspended": self.suspended,
+        }
+
+
+class SessionRegistry:
+    """All open sessions in this process."""
+
+    def __init__(self):
+        self.sessions = {}
+
+    def register(self, session_id):
+        stats = SessionStats(session_id)
+        self.sessions[session_id] = stats
+        return stats
+
+    def unregister(self, session_id):
+        self.sessions.pop(session_id, None)
+
+    def heaviest(self, n=5, by="cpu"):
+        """Return the n heaviest sessions, by "cpu", "memory" or "widgets"."""
+        if by == "memory":
+            key = SessionStats.total_frame_bytes
+        elif by == "widgets":
+            key = lambda stats: len(stats.widgets)
+        else:
+            key = SessionStats.total_cpu_seconds
+        return sorted(self.sessions.values(), key=key, reverse=True)[:n]
+
+    def report(self, n=5):
+        """Return a multi-line report of session counts and the heaviest sessions."""
+        active = sum(1 for stats in self.sessions.values() if not stats.suspended)
+        widgets = sum(len(stats.widgets) for stats in self.sessions.values())
+        lines = [f"Sessions: {len(self.sessions)} open, {active} active, {widgets} widgets"]
+        for stats in self.heaviest(n, by="cpu"):
+            lines.append(f"  {stats.summary()}")
+        return "\n".join(lines)
+
+
+# One registry shared by every session in this process
+session_registry = SessionRegistry()
@@ -0,0 +1,138 @@
+"""
+Purpose: Publish CSV data snapshots atomically and detect real changes.
+
+Writing a CSV file in place lets a reader see a half-written file. Instead,
+publish_snapshot() writes the new data to a temporary file in the same
+folder and renames it over the old one (a rename is atomic), then does the
+same for a small manifest file next to it, e.g. beaches.manifest.json:
+
+    {"generation": 42, "sha256": "...", "rows": 100, "published": "..."}
+
+If the new data is identical to the last snapshot, nothing is written, and
+readers that poll get_snapshot_version() only re-parse the CSV when the
+content hash actually changes. read_snapshot() parses each snapshot once
+and shares the result between readers.
+"""
+
+# Standard Library
+from datetime import datetime
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+import tempfile
+
+# External Packages
+import pandas as pd
+
+# Local Imports
+from util_diagnostics import stage
+
+# Remember the last manifest we read, so polling only re-reads it when it changes
+_manifest_cache = {}
+
+# The last snapshot parsed for each file, shared by every session that reads it
+_snapshot_cache = {}
+
+
+def get_manifest_path(file_path):
+    """Return the manifest path for a data file (data/beaches.csv -> data/beaches.manifest.json)."""
+    file_path = Path(file_path)
+    return file_path.with_name(file_path.stem + ".manifest.json")
+
+
+def write_atomically(file_path, content):
+    """Write bytes to a temporary file in the same folder, then rename it over file_path."""
+    file_path = Path(file_path)
+    fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(content)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def read_manifest(file_path):
+    """Return the manifest dictionary for a data file, or None if there isn't one."""
+    manifest_path = get_manifest_path(file_path)
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def publish_snapshot(df, file_path):
+    """Atomically publish df as a CSV snapshot and return its manifest.
+
+    If the content is unchanged since the last snapshot, nothing is written.
+    """
+    content = df.to_csv(index=False).encode("utf-8")
+    content_hash = hashlib.sha256(content).hexdigest()
+
+    manifest = read_manifest(file_path)
+    if manifest is not None and manifest.get("sha256") == content_hash and Path(file_path).exists():
+        return manifest
+
+    generation = manifest["generation"] + 1 if manifest is not None else 1
+    manifest = {
+        "generation": generation,
+        "sha256": content_hash,
+        "rows": len(df),
+        "published": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    # Data first, then the manifest, so the manifest never points ahead of the data
+    with stage(f"write:{Path(file_path).name}"):
+        write_atomically(file_path, content)
+        write_atomically(get_manifest_path(file_path), json.dumps(manifest).encode("utf-8"))
+    return manifest
+
+
+def get_snapshot_version(file_path):
+    """Return a value that changes only when the published data changes.
+
+    This is cheap enough to poll: the manifest is only re-read when its
+    modification time changes. Without a manifest, the data file's
+    modification time is used instead.
+    """
+    manifest_path = get_manifest_path(file_path)
+    try:
+        mtime = manifest_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return os.stat(file_path).st_mtime_ns
+
+    cached = _manifest_cache.get(manifest_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    manifest = read_manifest(file_path)
+    version = manifest["sha256"] if manifest is not None else mtime
+    _manifest_cache[manifest_path] = (mtime, version)
+    return version
+
+
+def read_snapshot(file_path):
+    """Return the DataFrame in a snapshot and the content hash of the bytes parsed.
+
+    The hash is computed from the exact bytes read, so it always matches the
+    data, even if a new snapshot is published while we are reading.
+
+    Each snapshot is parsed once and the same DataFrame is returned to every
+    caller, so sessions share one copy - treat it as read-only.
+    """
+    content = Path(file_path).read_bytes()
+    content_hash = hashlib.sha256(content).hexdigest()
+
+    cached = _snapshot_cache.get(file_path)
+    if cached is not None and cached[0] == content_hash:
+        return cached[1], content_hash
+
+    with stage(f"parse:{Path(file_path).name}"):
+        df = pd.read_csv(io.BytesIO(content))
+    _snapshot_cache[file_path] = (content_hash, df)
+    return df, content_hash